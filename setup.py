@@ -11,6 +11,9 @@ setup(
         "mediainfo>=5.0.0",
         "mktorrent>=1.1",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     
     # Metadata
     author="LounisBou",
@@ -25,7 +28,6 @@ setup(
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -42,5 +44,5 @@ setup(
 
     
     # Python requirements
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )
\ No newline at end of file
@@ -1,8 +1,36 @@
 #!/usr/bin/env python 
 # -*- coding: utf-8 -*-
 
-# Import key classes and functions for easier access
-from .torrentmate import TorrentMate
-from .contentanalyzer import ContentAnalyzer
-from .contentgenerator import ContentGenerator
-from .mediainfo import MediaInfo
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+# Key classes for easier access, imported on first use (PEP 562)
+_EXPORTS = {
+    'TorrentMate': '.torrentmate',
+    'ContentAnalyzer': '.contentanalyzer',
+    'ContentGenerator': '.contentgenerator',
+    'MediaInfo': '.mediainfo',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an exported class from its module on first access.
+    
+    :param name: str - Name of the requested attribute
+    :return: Any - Exported class, cached in the module globals
+    """
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> List[str]:
+    """
+    List the module attributes, including the exports not imported yet.
+    
+    :return: List[str] - Sorted attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
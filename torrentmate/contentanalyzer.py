@@ -4,8 +4,178 @@
 import os
 import sys
 import re
-from datetime import datetime
-from typing import Tuple, Set, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Iterable, Iterator, List, NamedTuple, Tuple, Set, Any
+
+# Series detection: S01E01, Saison 1, Season 1, saisons 1, seasons 1
+_SERIES_RE = re.compile(r'([sS]\d+[eE]\d+|[sS](?:aison|eason)s?\s*\d+)', re.IGNORECASE)
+# Season folder names: Saison 1, Season 1, saisons 1, seasons 1
+_SEASON_FOLDER_RE = re.compile(r'[sS](?:aison|eason)s?\s*\d+', re.IGNORECASE)
+# Season number in episode filenames: S01E01
+_SXX_RE = re.compile(r'[sS](\d+)[eE]')
+# Title and year in folder names: "Title (2010)", "Title (1997-2007)", "Title 2010 ..."
+_TITLE_PAREN_YEAR_RE = re.compile(r'(.+?)\s*\((\d{4})(?:-\d{4})?\)')
+_TITLE_YEAR_RE = re.compile(r'(.+?)\s+(\d{4})(?:\s|$)')
+
+_VIDEO_EXTENSIONS = frozenset(('.mkv', '.mp4', '.avi'))
+
+# Above this many subfolders, they are scanned in parallel
+_PARALLEL_SCAN_MIN_SUBFOLDERS = 4
+
+def _is_video_file(entry: os.DirEntry) -> bool:
+    """
+    Check if a directory entry is a video file.
+    
+    :param entry: os.DirEntry - Directory entry to check
+    :return: bool - True if the entry is a video file, False otherwise
+    """
+    name = entry.name
+    return (not entry.is_dir(follow_symlinks=False)
+            and name[name.rfind('.'):].lower() in _VIDEO_EXTENSIONS)
+
+def _iter_video_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Walk a folder recursively and yield its video files, in the same order as os.walk.
+    
+    :param root: str - Path to the folder to walk
+    :return: Iterator[os.DirEntry] - Directory entries of the video files found
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable folders are skipped, as os.walk does
+            continue
+        
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subfolders.append(entry.path)
+            elif _is_video_file(entry):
+                yield entry
+        
+        # Reversed so that subfolders are popped in listing order
+        stack.extend(reversed(subfolders))
+
+def _find_parenthesized_year(name: str) -> int:
+    """
+    Find a year in parentheses, such as "(2010)" or "(1997-2007)", preceded by a title.
+    
+    :param name: str - Folder name to search
+    :return: int - Index of the opening parenthesis, -1 if not found
+    """
+    start = name.find('(', 1)
+    while start != -1:
+        year = name[start + 1:start + 5]
+        if len(year) == 4 and year.isdecimal():
+            after = name[start + 5:start + 11]
+            if after[:1] == ')':
+                return start
+            end_year = after[1:5]
+            if after[:1] == '-' and len(end_year) == 4 and end_year.isdecimal() and after[5:6] == ')':
+                return start
+        start = name.find('(', start + 1)
+    return -1
+
+def _scan_video_files(videos: Iterable[os.DirEntry], series_detected: bool = False) -> Tuple[int, Set[int], str, bool]:
+    """
+    Collect episode information from video files.
+    
+    :param videos: Iterable[os.DirEntry] - Directory entries of the video files
+    :param series_detected: bool - True if the content is already known to be a series,
+                            filenames are then not checked against the series patterns
+    :return: Tuple[int, Set[int], str, bool] - (episode count, season numbers, first video path,
+             whether a filename looks like an episode)
+    """
+    episode_count = 0
+    season_numbers: Set[int] = set()
+    first_video = ""
+    
+    for entry in videos:
+        if not first_video:
+            first_video = entry.path
+        episode_count += 1
+        
+        if not series_detected and _SERIES_RE.search(entry.name):
+            series_detected = True
+        
+        # Look for S01E01 or similar, files spanning two seasons (S01E24-S02E01) count for both
+        for match in _SXX_RE.finditer(entry.name):
+            season_numbers.add(int(match.group(1)))
+    
+    return episode_count, season_numbers, first_video, series_detected
+
+def _scan_subfolder(path: str, series_detected: bool = False) -> Tuple[int, Set[int], str, bool]:
+    """
+    Collect episode information from the video files of a folder, recursively.
+    
+    :param path: str - Path to the folder to scan
+    :param series_detected: bool - Same as _scan_video_files
+    :return: Tuple[int, Set[int], str, bool] - Same as _scan_video_files
+    """
+    return _scan_video_files(_iter_video_files(path), series_detected)
+
+class _TreeScan(NamedTuple):
+    """
+    Everything ContentAnalyzer needs from the content folder, collected in a single walk.
+    """
+    folder_name: str
+    subfolder_names: List[str]
+    episode_count: int
+    season_numbers: Set[int]
+    first_video: str
+    series_detected: bool
+
+def _scan_tree(folder_path: str) -> _TreeScan:
+    """
+    Walk a content folder once and collect its top-level folder names, episode count,
+    season numbers, first video file and whether a name looks like a series.
+    
+    :param folder_path: str - Path to the folder containing media content
+    :return: _TreeScan - Result of the scan
+    """
+    folder_name = os.path.basename(os.path.normpath(folder_path))
+    
+    with os.scandir(folder_path) as it:
+        entries = list(it)
+    subfolders = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    
+    # Names of the top-level folders, symlinks included, for the season folder checks
+    subfolder_names = [entry.name for entry in entries if entry.is_dir()]
+    
+    # Check the folder name and subfolder names first, filenames are
+    # then only matched against the series patterns until one hits
+    series_detected = (bool(_SERIES_RE.search(folder_name))
+                       or any(_SERIES_RE.search(name) for name in subfolder_names))
+    
+    # Video files at the top level come first, as with os.walk
+    results: List[Tuple[int, Set[int], str, bool]] = [
+        _scan_video_files((entry for entry in entries if _is_video_file(entry)), series_detected)
+    ]
+    series_detected = results[0][3]
+    
+    # Season folders are independent, scan them in parallel when there are many
+    if len(subfolders) > _PARALLEL_SCAN_MIN_SUBFOLDERS:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            results.extend(executor.map(_scan_subfolder, subfolders, repeat(series_detected)))
+    else:
+        for path in subfolders:
+            results.append(_scan_subfolder(path, series_detected))
+            series_detected = results[-1][3]
+    
+    total_count = 0
+    all_season_numbers: Set[int] = set()
+    first_video_path = ""
+    for episode_count, season_numbers, first_video, _ in results:
+        total_count += episode_count
+        all_season_numbers |= season_numbers
+        first_video_path = first_video_path or first_video
+    
+    return _TreeScan(folder_name, subfolder_names, total_count, all_season_numbers,
+                     first_video_path, any(result[3] for result in results))
 
 class ContentAnalyzer:
     """
@@ -15,10 +185,33 @@ class ContentAnalyzer:
     def __init__(self, folder_path: str):
         """
         Initialize the ContentAnalyzer with a folder path.
+        Kept for backward compatibility, same as ContentAnalyzer.from_folder(folder_path).
+        
+        :param folder_path: str - Path to the folder containing media content
+        """
+        self._load(folder_path, _scan_tree(folder_path))
+
+    @classmethod
+    def from_folder(cls, folder_path: str) -> 'ContentAnalyzer':
+        """
+        Analyze a folder, scanning it once and deriving every field from that scan.
+        
+        :param folder_path: str - Path to the folder containing media content
+        :return: ContentAnalyzer - Analyzer with all fields set
+        """
+        analyzer = cls.__new__(cls)
+        analyzer._load(folder_path, _scan_tree(folder_path))
+        return analyzer
+
+    def _load(self, folder_path: str, scan: _TreeScan) -> None:
+        """
+        Set all fields of the analyzer from the scan of its folder.
         
         :param folder_path: str - Path to the folder containing media content
+        :param scan: _TreeScan - Result of the folder scan
         """
         self.folder_path = folder_path
+        self._scan = scan
         self.content_type = self._detect_content_type()
         self.title, self.year = self._extract_title_year()
         
@@ -37,44 +230,12 @@ class ContentAnalyzer:
         
         :return: str - "serie" or "film"
         """
-        folder_name = os.path.basename(os.path.normpath(self.folder_path))
-        
-        # Regex patterns to detect series (seasons, episodes)
-        series_patterns = [
-            r'[sS]\d+[eE]\d+',  # S01E01
-            r'[sS]aison\s*\d+',  # Saison 1
-            r'[sS]eason\s*\d+',  # Season 1
-            r'saisons?\s*\d+',   # saison 1
-            r'seasons?\s*\d+'    # season 1
-        ]
-        
-        # Check folder name
-        for pattern in series_patterns:
-            if re.search(pattern, folder_name, re.IGNORECASE):
-                return "serie"
-        
-        # Check subfolders
-        for item in os.listdir(self.folder_path):
-            full_path = os.path.join(self.folder_path, item)
-            if os.path.isdir(full_path):
-                for pattern in series_patterns:
-                    if re.search(pattern, item, re.IGNORECASE):
-                        return "serie"
-        
-        # Check files
-        video_extensions = ['.mkv', '.mp4', '.avi']
-        episode_count = 0
-        
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in video_extensions):
-                    episode_count += 1
-                    for pattern in series_patterns:
-                        if re.search(pattern, file, re.IGNORECASE):
-                            return "serie"
+        # Folder name, subfolder names and filenames were checked by the folder scan
+        if self._scan.series_detected:
+            return "serie"
         
         # If multiple video files, probably a series
-        if episode_count > 1:
+        if self._scan.episode_count > 1:
             return "serie"
         
         # Default to movie
@@ -86,18 +247,30 @@ class ContentAnalyzer:
         
         :return: Tuple[str, str] - (title, year)
         """
-        folder_name = os.path.basename(os.path.normpath(self.folder_path))
-        
-        # Regex to extract title and year
-        match = re.search(r'(.+?)\s*\((\d{4})(?:-\d{4})?\)', folder_name)
+        folder_name = self._scan.folder_name
         
-        if match:
-            title = match.group(1).strip()
-            year = match.group(2)
-            return title, year
+        # Fast path with string methods. The regexes below stop their title at a
+        # line break, which these methods don't, so such names go to the slow path.
+        if '\n' not in folder_name:
+            # Year in parentheses: "Title (2010)" or "Title (1997-2007)"
+            start = _find_parenthesized_year(folder_name)
+            if start != -1:
+                return folder_name[:start].strip(), folder_name[start + 1:start + 5]
+            
+            # Standalone year after the title: "Title 2010 ..."
+            words = folder_name.split()
+            # The title and the whitespace before the year take one character each
+            # at least, so the first word can only be the year if the name starts
+            # with two whitespace characters (the first one then being the title)
+            first = 0 if folder_name[:2].isspace() else 1
+            for index in range(first, len(words)):
+                word = words[index]
+                if len(word) == 4 and word.isdecimal():
+                    rest = folder_name.split(None, index)[index]
+                    return folder_name[:len(folder_name) - len(rest)].strip(), word
         
-        # Try other formats if no year in parentheses
-        match = re.search(r'(.+?)\s+(\d{4})(?:\s|$)', folder_name)
+        # Slow path with regexes for names with line breaks
+        match = _TITLE_PAREN_YEAR_RE.search(folder_name) or _TITLE_YEAR_RE.search(folder_name)
         if match:
             title = match.group(1).strip()
             year = match.group(2)
@@ -112,15 +285,7 @@ class ContentAnalyzer:
         
         :return: int - Number of episodes
         """
-        video_extensions = ['.mkv', '.mp4', '.avi']
-        episode_count = 0
-        
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in video_extensions):
-                    episode_count += 1
-        
-        return episode_count
+        return self._scan.episode_count
 
     def _count_seasons(self) -> int:
         """
@@ -128,40 +293,12 @@ class ContentAnalyzer:
         
         :return: int - Number of seasons
         """
-        season_patterns = [
-            r'[sS]aison\s*\d+',  # Saison 1
-            r'[sS]eason\s*\d+',  # Season 1
-            r'saisons?\s*\d+',   # saison 1
-            r'seasons?\s*\d+'    # season 1
-        ]
-        
-        season_count = 0
-        season_folders: Set[str] = set()
-        
         # Look for season folders
-        for item in os.listdir(self.folder_path):
-            full_path = os.path.join(self.folder_path, item)
-            if os.path.isdir(full_path):
-                for pattern in season_patterns:
-                    if re.search(pattern, item, re.IGNORECASE):
-                        season_folders.add(item)
-                        season_count += 1
-                        break
-        
-        # If no season folders, check video files
+        season_count = sum(1 for name in self._scan.subfolder_names if _SEASON_FOLDER_RE.search(name))
+        
+        # If no season folders, use the season numbers found in video files
         if season_count == 0:
-            season_numbers: Set[int] = set()
-            video_extensions = ['.mkv', '.mp4', '.avi']
-            
-            for root, _, files in os.walk(self.folder_path):
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in video_extensions):
-                        # Look for S01E01 or similar
-                        match = re.search(r'[sS](\d+)[eE]', file)
-                        if match:
-                            season_numbers.add(int(match.group(1)))
-            
-            season_count = len(season_numbers)
+            season_count = len(self._scan.season_numbers)
         
         return max(1, season_count)  # At least 1 season
 
@@ -171,6 +308,8 @@ class ContentAnalyzer:
         
         :return: str - Year range (e.g., "1997-2007")
         """
+        from datetime import datetime
+        
         if not self.year:
             return "Unknown"
             
@@ -184,16 +323,12 @@ class ContentAnalyzer:
 
     def find_first_video_file(self) -> str:
         """
-        Find the first video file in the folder (recursively).
+        Find the first video file in the folder (recursively), as recorded by the folder scan.
         
         :return: str - Path to the first video file
         """
-        video_extensions = ['.mkv', '.mp4', '.avi']
-        
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in video_extensions):
-                    return os.path.join(root, file)
+        if self._scan.first_video:
+            return self._scan.first_video
         
         print("No video files found in the folder.")
         sys.exit(1)
@@ -1,14 +1,164 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any
+import textwrap
+from typing import Dict, Any, Optional, Tuple
 from .contentanalyzer import ContentAnalyzer
 
+# Defaults of the list fields, tuples so that no list is built on each lookup
+_UNK = ('Unknown',)
+_NONE = ('None',)
+
+# Decorative banners of the NFO files
+_BAR = "░" * 74
+_HEADER_FMT = _BAR + "\n" + "░" * 22 + " {title} ({year}) " + "░" * 25 + "\n" + _BAR
+
+# Raw mediainfo output placed at the beginning of the NFO files
+_RAW_MEDIAINFO_FMT = ("\n"
+                      "MEDIAINFO OUTPUT:\n"
+                      "================================================================================\n"
+                      "{raw_mediainfo}\n"
+                      "================================================================================\n"
+                      "\n")
+
+# Templates, dedented once at import and formatted with str.format_map.
+# Some lines end with a space that is part of the output.
+_SERIE_NFO_TMPL = textwrap.dedent("""\
+    {raw_mediainfo_section}{header}
+
+    ▓ INFORMATIONS GÉNÉRALES
+    ▪ Titre.............: {title}
+    ▪ Année.............: {year_range}
+    ▪ Genres............: À compléter
+    ▪ Créateurs.........: À compléter
+    ▪ Acteurs principaux.: À compléter
+    ▪ Saisons...........: {season_label}
+    ▪ Langue............: {language}
+
+    ▓ INFORMATIONS TECHNIQUES
+    ▪ Format............: {format}
+    ▪ Durée moyenne.....: ~{duration} minutes par épisode
+    ▪ Source............: {source}
+    ▪ Résolution........: {resolution} ({width}x{height})
+    ▪ Codec Vidéo.......: {video_codec}
+    ▪ Bitrate Vidéo.....: ~{bitrate} kb/s
+    ▪ Codec Audio.......: {audio_codecs}
+    ▪ Sous-titres.......: {subtitles}
+
+    ▓ SYNOPSIS
+    À compléter
+
+    ▓ INFORMATIONS COMPLÉMENTAIRES
+    Ce torrent contient l'intégrale de la série {title}, de la saison 1 à la saison {season_count}, en version {language_tag}. Chaque épisode est accompagné de son fichier NFO détaillé et d'une miniature.
+
+""") + _BAR
+
+_FILM_NFO_TMPL = textwrap.dedent("""\
+    {raw_mediainfo_section}{header}
+
+    ▓ INFORMATIONS GÉNÉRALES
+    ▪ Titre.............: {title}
+    ▪ Année.............: {year}
+    ▪ Genres............: À compléter
+    ▪ Réalisateur.......: À compléter
+    ▪ Acteurs principaux.: À compléter
+    ▪ Langue............: {language}
+
+    ▓ INFORMATIONS TECHNIQUES
+    ▪ Format............: {format}
+    ▪ Durée.............: {duration} minutes
+    ▪ Source............: {source}
+    ▪ Résolution........: {resolution} ({width}x{height})
+    ▪ Codec Vidéo.......: {video_codec}
+    ▪ Bitrate Vidéo.....: ~{bitrate} kb/s
+    ▪ Codec Audio.......: {audio_codecs}
+    ▪ Sous-titres.......: {subtitles}
+
+    ▓ SYNOPSIS
+    À compléter
+
+""") + _BAR
+
+_SERIE_BBCODE_TMPL = textwrap.dedent("""\
+    [center][img]https://URL_DE_VOTRE_IMAGE/poster.jpg[/img][/center]
+
+    [center][size=18][b]{torrent_title}[/b][/size][/center]
+
+
+    [center][img]https://forward.pm/img/informations.png[/img]
+
+    [b]Créateurs:[/b] À compléter
+    [b]Acteurs:[/b] 
+    Acteur 1, 
+    Acteur 2, 
+    Acteur 3, 
+    Acteur 4
+    [b]Durée:[/b] {bbcode_duration}
+    [b]Genre:[/b] À compléter
+    [b]Diffusion:[/b] {year_range}[/center]
+
+    [center][img]https://forward.pm/img/synopsis.png[/img]
+
+    À compléter[/center]
+
+    [center][img]https://forward.pm/img/upload.png[/img]
+    [/center][center][b]Format:[/b] {format}
+    [b]Langues:[/b] {language} ({audio_languages})
+    [b]Source:[/b] {source}
+    [b]Résolution: [/b]{resolution} ({width}x{height})
+    [b]Codec vidéo:[/b] {video_codec_short}
+    [b]Bitrate vidéo:[/b] ~{bitrate} kb/s
+    [b]Codec audio:[/b] {audio_codecs}
+    [b]Sous-titres:[/b] {subtitles}
+    [b]Nombre d'épisodes: [/b]{episode_count}
+    [b]Nombre de saisons:[/b] {season_count}[/center][left][/left][left][/left]
+
+""")
+
+_FILM_BBCODE_TMPL = textwrap.dedent("""\
+    [center][img]https://URL_DE_VOTRE_IMAGE/poster.jpg[/img][/center]
+
+    [center][size=18][b]{torrent_title}[/b][/size][/center]
+
+
+    [center][img]https://forward.pm/img/informations.png[/img]
+
+    [b]Réalisateur:[/b] À compléter
+    [b]Acteurs:[/b] 
+    Acteur 1, 
+    Acteur 2, 
+    Acteur 3
+    [b]Durée:[/b] {bbcode_duration}
+    [b]Genre:[/b] À compléter
+    [b]Année de sortie:[/b] {year}[/center]
+
+    [center][img]https://forward.pm/img/synopsis.png[/img]
+
+    À compléter[/center]
+
+    [center][img]https://forward.pm/img/upload.png[/img]
+    [/center][center][b]Format:[/b] {format}
+    [b]Langues:[/b] {language} ({audio_languages})
+    [b]Source:[/b] {source}
+    [b]Résolution: [/b]{resolution} ({width}x{height})
+    [b]Codec vidéo:[/b] {video_codec_short}
+    [b]Bitrate vidéo:[/b] ~{bitrate} kb/s
+    [b]Codec audio:[/b] {audio_codecs}
+    [b]Sous-titres:[/b] {subtitles}
+    [b]Durée:[/b] {bbcode_duration}[/center][left][/left][left][/left]
+
+""")
+
 class ContentGenerator:
     """
     Class to generate NFO and BBCode content from media metadata.
     """
 
+    __slots__ = ('media_info', 'analyzer',
+                 'format', 'source', 'resolution', 'width', 'height', 'video_codec', 'video_codec_short',
+                 'language', 'audio_languages', 'audio_codecs', 'subtitles', 'bitrate_kbps', 'duration_min',
+                 '_nfo_tmpl', '_bbcode_tmpl', '_context', '_torrent_title', '_nfo', '_bbcode')
+
     def __init__(self, media_info: Dict[str, Any], analyzer: ContentAnalyzer):
         """
         Initialize the ContentGenerator.
@@ -18,6 +168,38 @@ class ContentGenerator:
         """
         self.media_info = media_info
         self.analyzer = analyzer
+        
+        # Displayed media fields, read once, with lists joined
+        mi_get = media_info.get
+        self.format = mi_get('format', 'Unknown')
+        self.source = mi_get('source', 'Unknown')
+        self.resolution = mi_get('resolution', 'Unknown')
+        self.width = mi_get('width', 'Unknown')
+        self.height = mi_get('height', 'Unknown')
+        self.video_codec = mi_get('video_codec', 'Unknown')
+        self.video_codec_short = mi_get('video_codec_short', 'Unknown')
+        self.language = mi_get('language_tag', 'Unknown')
+        self.audio_languages = ', '.join(mi_get('audio_languages', _UNK))
+        self.audio_codecs = ', '.join(mi_get('audio_codecs', _UNK))
+        self.subtitles = ', '.join(mi_get('subtitle_languages', _NONE))
+        
+        # Bitrate (kb/s) and duration (minutes) if available
+        self.bitrate_kbps = str(mi_get('overall_bitrate_kbps', '?'))
+        self.duration_min = str(mi_get('duration_min', '?'))
+        
+        if analyzer.content_type == "serie":
+            self._nfo_tmpl = _SERIE_NFO_TMPL
+            self._bbcode_tmpl = _SERIE_BBCODE_TMPL
+        else:  # Film
+            self._nfo_tmpl = _FILM_NFO_TMPL
+            self._bbcode_tmpl = _FILM_BBCODE_TMPL
+        
+        # Neither input changes after construction, so generated strings are cached.
+        # NFO and BBCode depend on an argument, keep the last (argument, content) of each.
+        self._context: Optional[Dict[str, Any]] = None
+        self._torrent_title: Optional[str] = None
+        self._nfo: Optional[Tuple[str, str]] = None
+        self._bbcode: Optional[Tuple[str, str]] = None
 
     def generate_torrent_title(self) -> str:
         """
@@ -25,14 +207,19 @@ class ContentGenerator:
         
         :return: str - Formatted torrent title
         """
-        if self.analyzer.content_type == "serie":
-            return (f"{self.analyzer.title} ({self.analyzer.year_range}) - Intégrale - "
-                    f"{self.media_info.get('language_tag', '')} - {self.media_info.get('source', '')} - "
-                    f"{self.media_info.get('resolution', '')} - {self.media_info.get('video_codec', '').split(' ')[0]}")
+        if self._torrent_title is not None:
+            return self._torrent_title
+        
+        mi_get = self.media_info.get
+        media_part = (f"{mi_get('language_tag', '')} - {mi_get('source', '')} - "
+                      f"{mi_get('resolution', '')} - {mi_get('video_codec_short', '')}")
+        
+        analyzer = self.analyzer
+        if analyzer.content_type == "serie":
+            self._torrent_title = f"{analyzer.title} ({analyzer.year_range}) - Intégrale - {media_part}"
         else:  # Film
-            return (f"{self.analyzer.title} ({self.analyzer.year}) - "
-                    f"{self.media_info.get('language_tag', '')} - {self.media_info.get('source', '')} - "
-                    f"{self.media_info.get('resolution', '')} - {self.media_info.get('video_codec', '').split(' ')[0]}")
+            self._torrent_title = f"{analyzer.title} ({analyzer.year}) - {media_part}"
+        return self._torrent_title
 
     def generate_nfo_content(self, raw_mediainfo: str = "") -> str:
         """
@@ -41,248 +228,114 @@ class ContentGenerator:
         :param raw_mediainfo: str - Raw mediainfo output to include at the beginning
         :return: str - Formatted NFO content
         """
-        if self.analyzer.content_type == "serie":
-            return self._generate_serie_nfo(raw_mediainfo)
-        else:
-            return self._generate_film_nfo(raw_mediainfo)
+        if self._nfo is None or self._nfo[0] != raw_mediainfo:
+            self._nfo = (raw_mediainfo, self._generate_nfo(raw_mediainfo))
+        return self._nfo[1]
 
-    def _generate_serie_nfo(self, raw_mediainfo: str = "") -> str:
+    def generate_bbcode_content(self, torrent_title: str = "") -> str:
         """
-        Generate NFO content for a TV series.
+        Generate BBCode content for forum posting.
         
-        :param raw_mediainfo: str - Raw mediainfo output to include at the beginning
-        :return: str - Formatted NFO content for a series
+        :param torrent_title: str - Torrent title to display, generated if not provided
+        :return: str - Formatted BBCode content
         """
-        title = self.analyzer.title
-        year_range = self.analyzer.year_range
-        
-        # Format bitrate and duration if available
-        bitrate = "?"
-        if self.media_info.get('overall_bitrate', '0').isdigit():
-            bitrate = str(int(int(self.media_info.get('overall_bitrate', '0')) / 1000))
-            
-        duration = "?"
-        if self.media_info.get('duration', '0').replace('.', '', 1).isdigit():
-            duration = str(int(float(self.media_info.get('duration', '0')) / 60))
-        
-        # Add raw mediainfo at the beginning if provided
-        raw_mediainfo_section = ""
-        if raw_mediainfo:
-            raw_mediainfo_section = f"""
-            MEDIAINFO OUTPUT:
-            ================================================================================
-            {raw_mediainfo}
-            ================================================================================
-
-            """
+        torrent_title = torrent_title or self.generate_torrent_title()
+        if self._bbcode is None or self._bbcode[0] != torrent_title:
+            self._bbcode = (torrent_title, self._generate_bbcode(torrent_title))
+        return self._bbcode[1]
+
+    def generate_all(self, raw_mediainfo: str = "") -> Dict[str, str]:
+        """
+        Generate the torrent title, NFO and BBCode contents, sharing the formatted media values.
         
-        return f"""{raw_mediainfo_section}░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
-        ░░░░░░░░░░░░░░░░░░░░░░ {title.upper()} ({year_range}) ░░░░░░░░░░░░░░░░░░░░░░░░░
-        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
-
-        ▓ INFORMATIONS GÉNÉRALES
-        ▪ Titre.............: {title}
-        ▪ Année.............: {year_range}
-        ▪ Genres............: À compléter
-        ▪ Créateurs.........: À compléter
-        ▪ Acteurs principaux.: À compléter
-        ▪ Saisons...........: {self.analyzer.season_count} saison{'s' if self.analyzer.season_count > 1 else ''} ({self.analyzer.episode_count} épisode{'s' if self.analyzer.episode_count > 1 else ''})
-        ▪ Langue............: {self.media_info.get('language_tag', 'Unknown')}
-
-        ▓ INFORMATIONS TECHNIQUES
-        ▪ Format............: {self.media_info.get('format', 'Unknown')}
-        ▪ Durée moyenne.....: ~{duration} minutes par épisode
-        ▪ Source............: {self.media_info.get('source', 'Unknown')}
-        ▪ Résolution........: {self.media_info.get('resolution', 'Unknown')} ({self.media_info.get('width', 'Unknown')}x{self.media_info.get('height', 'Unknown')})
-        ▪ Codec Vidéo.......: {self.media_info.get('video_codec', 'Unknown')}
-        ▪ Bitrate Vidéo.....: ~{bitrate} kb/s
-        ▪ Codec Audio.......: {', '.join(self.media_info.get('audio_codecs', ['Unknown']))}
-        ▪ Sous-titres.......: {', '.join(self.media_info.get('subtitle_languages', ['None']))}
-
-        ▓ SYNOPSIS
-        À compléter
-
-        ▓ INFORMATIONS COMPLÉMENTAIRES
-        Ce torrent contient l'intégrale de la série {title}, de la saison 1 à la saison {self.analyzer.season_count}, en version {self.media_info.get('language_tag', '')}. Chaque épisode est accompagné de son fichier NFO détaillé et d'une miniature.
-
-        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░"""
-
-    def _generate_film_nfo(self, raw_mediainfo: str = "") -> str:
+        :param raw_mediainfo: str - Raw mediainfo output to include at the beginning of the NFO
+        :return: Dict[str, str] - Generated contents, by 'title', 'nfo' and 'bbcode'
+        """
+        return {
+            'title': self.generate_torrent_title(),
+            'nfo': self.generate_nfo_content(raw_mediainfo),
+            'bbcode': self.generate_bbcode_content(),
+        }
+
+    def _generate_nfo(self, raw_mediainfo: str) -> str:
         """
-        Generate NFO content for a movie.
+        Generate NFO content for the analyzed content type.
         
         :param raw_mediainfo: str - Raw mediainfo output to include at the beginning
-        :return: str - Formatted NFO content for a movie
+        :return: str - Formatted NFO content
         """
-        title = self.analyzer.title
-        year = self.analyzer.year
-        
-        # Format bitrate and duration if available
-        bitrate = "?"
-        if self.media_info.get('overall_bitrate', '0').isdigit():
-            bitrate = str(int(int(self.media_info.get('overall_bitrate', '0')) / 1000))
-            
-        duration = "?"
-        if self.media_info.get('duration', '0').replace('.', '', 1).isdigit():
-            duration = str(int(float(self.media_info.get('duration', '0')) / 60))
-        
-        # Add raw mediainfo at the beginning if provided
-        raw_mediainfo_section = ""
-        if raw_mediainfo:
-            raw_mediainfo_section = f"""
-            MEDIAINFO OUTPUT:
-            ================================================================================
-            {raw_mediainfo}
-            ================================================================================
-
-            """
-        
-        return f"""{raw_mediainfo_section}░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
-        ░░░░░░░░░░░░░░░░░░░░░░ {title.upper()} ({year}) ░░░░░░░░░░░░░░░░░░░░░░░░░
-        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
-
-        ▓ INFORMATIONS GÉNÉRALES
-        ▪ Titre.............: {title}
-        ▪ Année.............: {year}
-        ▪ Genres............: À compléter
-        ▪ Réalisateur.......: À compléter
-        ▪ Acteurs principaux.: À compléter
-        ▪ Langue............: {self.media_info.get('language_tag', 'Unknown')}
-
-        ▓ INFORMATIONS TECHNIQUES
-        ▪ Format............: {self.media_info.get('format', 'Unknown')}
-        ▪ Durée.............: {duration} minutes
-        ▪ Source............: {self.media_info.get('source', 'Unknown')}
-        ▪ Résolution........: {self.media_info.get('resolution', 'Unknown')} ({self.media_info.get('width', 'Unknown')}x{self.media_info.get('height', 'Unknown')})
-        ▪ Codec Vidéo.......: {self.media_info.get('video_codec', 'Unknown')}
-        ▪ Bitrate Vidéo.....: ~{bitrate} kb/s
-        ▪ Codec Audio.......: {', '.join(self.media_info.get('audio_codecs', ['Unknown']))}
-        ▪ Sous-titres.......: {', '.join(self.media_info.get('subtitle_languages', ['None']))}
-
-        ▓ SYNOPSIS
-        À compléter
-
-        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░"""
-
-    def generate_bbcode_content(self) -> str:
+        return self._nfo_tmpl.format_map(self._build_context(raw_mediainfo))
+
+    def _generate_bbcode(self, torrent_title: str) -> str:
         """
-        Generate BBCode content for forum posting.
+        Generate BBCode content for the analyzed content type.
         
+        :param torrent_title: str - Torrent title to display
         :return: str - Formatted BBCode content
         """
-        if self.analyzer.content_type == "serie":
-            return self._generate_serie_bbcode()
-        else:
-            return self._generate_film_bbcode()
+        return self._bbcode_tmpl.format_map(self._build_context(torrent_title=torrent_title))
 
-    def _generate_serie_bbcode(self) -> str:
+    def _build_context(self, raw_mediainfo: str = "", torrent_title: str = "") -> Dict[str, Any]:
         """
-        Generate BBCode content for a TV series.
+        Build the values of the NFO and BBCode templates.
         
-        :return: str - Formatted BBCode content for a series
+        :param raw_mediainfo: str - Raw mediainfo output to include at the beginning, may be empty
+        :param torrent_title: str - Torrent title to display, generated if not provided
+        :return: Dict[str, Any] - Template values
         """
-        title = self.analyzer.title
-        year_range = self.analyzer.year_range
-        
-        # Create torrent title according to rules
-        torrent_title = self.generate_torrent_title()
-        
-        # Format bitrate and duration if available
-        bitrate = "?"
-        if self.media_info.get('overall_bitrate', '0').isdigit():
-            bitrate = str(int(int(self.media_info.get('overall_bitrate', '0')) / 1000))
-            
-        duration = "45m"  # Default to 45 minutes for episode duration
-        if self.media_info.get('duration', '0').replace('.', '', 1).isdigit():
-            duration_min = int(float(self.media_info.get('duration', '0')) / 60)
-            duration = f"{duration_min}m"
-        
-        return f"""[center][img]https://URL_DE_VOTRE_IMAGE/poster.jpg[/img][/center]
-
-        [center][size=18][b]{torrent_title}[/b][/size][/center]
-
-
-        [center][img]https://forward.pm/img/informations.png[/img]
-
-        [b]Créateurs:[/b] À compléter
-        [b]Acteurs:[/b] 
-        Acteur 1, 
-        Acteur 2, 
-        Acteur 3, 
-        Acteur 4
-        [b]Durée:[/b] {duration}
-        [b]Genre:[/b] À compléter
-        [b]Diffusion:[/b] {year_range}[/center]
-
-        [center][img]https://forward.pm/img/synopsis.png[/img]
-
-        À compléter[/center]
-
-        [center][img]https://forward.pm/img/upload.png[/img]
-        [/center][center][b]Format:[/b] {self.media_info.get('format', 'Unknown')}
-        [b]Langues:[/b] {self.media_info.get('language_tag', 'Unknown')} ({', '.join(self.media_info.get('audio_languages', ['Unknown']))})
-        [b]Source:[/b] {self.media_info.get('source', 'Unknown')}
-        [b]Résolution: [/b]{self.media_info.get('resolution', 'Unknown')} ({self.media_info.get('width', 'Unknown')}x{self.media_info.get('height', 'Unknown')})
-        [b]Codec vidéo:[/b] {self.media_info.get('video_codec', 'Unknown').split(' ')[0]}
-        [b]Bitrate vidéo:[/b] ~{bitrate} kb/s
-        [b]Codec audio:[/b] {', '.join(self.media_info.get('audio_codecs', ['Unknown']))}
-        [b]Sous-titres:[/b] {', '.join(self.media_info.get('subtitle_languages', ['None']))}
-        [b]Nombre d'épisodes: [/b]{self.analyzer.episode_count}
-        [b]Nombre de saisons:[/b] {self.analyzer.season_count}[/center][left][/left][left][/left]
+        ctx = dict(self._media_context())
+        ctx['raw_mediainfo_section'] = _RAW_MEDIAINFO_FMT.format(raw_mediainfo=raw_mediainfo) if raw_mediainfo else ""
+        ctx['torrent_title'] = torrent_title or self.generate_torrent_title()
+        return ctx
 
+    def _media_context(self) -> Dict[str, Any]:
         """
-
-    def _generate_film_bbcode(self) -> str:
-        """
-        Generate BBCode content for a movie.
+        Format the template values that only depend on the media info and the analyzer, once.
         
-        :return: str - Formatted BBCode content for a movie
+        :return: Dict[str, Any] - Template values, with lists joined and "?" for an unknown
+                 bitrate or duration
         """
-        title = self.analyzer.title
-        year = self.analyzer.year
-        
-        # Create torrent title according to rules
-        torrent_title = self.generate_torrent_title()
+        if self._context is not None:
+            return self._context
         
-        # Format bitrate and duration if available
-        bitrate = "?"
-        if self.media_info.get('overall_bitrate', '0').isdigit():
-            bitrate = str(int(int(self.media_info.get('overall_bitrate', '0')) / 1000))
-            
-        duration = "?"
-        if self.media_info.get('duration', '0').replace('.', '', 1).isdigit():
-            duration_min = int(float(self.media_info.get('duration', '0')) / 60)
-            duration = f"{duration_min}m"
+        analyzer = self.analyzer
+        title = analyzer.title
+        year = analyzer.year
+        year_range = analyzer.year_range
+        season_count = analyzer.season_count
+        episode_count = analyzer.episode_count
+        duration = self.duration_min
+        if analyzer.content_type == "serie":
+            header_year = year_range
+            # Default to 45 minutes for episode duration
+            bbcode_duration = f"{duration}m" if duration != "?" else "45m"
+        else:  # Film
+            header_year = year
+            bbcode_duration = f"{duration}m" if duration != "?" else "?"
         
-        return f"""[center][img]https://URL_DE_VOTRE_IMAGE/poster.jpg[/img][/center]
-
-        [center][size=18][b]{torrent_title}[/b][/size][/center]
-
-
-        [center][img]https://forward.pm/img/informations.png[/img]
-
-        [b]Réalisateur:[/b] À compléter
-        [b]Acteurs:[/b] 
-        Acteur 1, 
-        Acteur 2, 
-        Acteur 3
-        [b]Durée:[/b] {duration}
-        [b]Genre:[/b] À compléter
-        [b]Année de sortie:[/b] {year}[/center]
-
-        [center][img]https://forward.pm/img/synopsis.png[/img]
-
-        À compléter[/center]
-
-        [center][img]https://forward.pm/img/upload.png[/img]
-        [/center][center][b]Format:[/b] {self.media_info.get('format', 'Unknown')}
-        [b]Langues:[/b] {self.media_info.get('language_tag', 'Unknown')} ({', '.join(self.media_info.get('audio_languages', ['Unknown']))})
-        [b]Source:[/b] {self.media_info.get('source', 'Unknown')}
-        [b]Résolution: [/b]{self.media_info.get('resolution', 'Unknown')} ({self.media_info.get('width', 'Unknown')}x{self.media_info.get('height', 'Unknown')})
-        [b]Codec vidéo:[/b] {self.media_info.get('video_codec', 'Unknown').split(' ')[0]}
-        [b]Bitrate vidéo:[/b] ~{bitrate} kb/s
-        [b]Codec audio:[/b] {', '.join(self.media_info.get('audio_codecs', ['Unknown']))}
-        [b]Sous-titres:[/b] {', '.join(self.media_info.get('subtitle_languages', ['None']))}
-        [b]Durée:[/b] {duration}[/center][left][/left][left][/left]
-
-        """
\ No newline at end of file
+        self._context = {
+            'header': _HEADER_FMT.format(title=title.upper(), year=header_year),
+            'title': title,
+            'year': year,
+            'year_range': year_range,
+            'season_count': season_count,
+            'season_label': (f"{season_count} saison{'s' if season_count > 1 else ''} "
+                             f"({episode_count} épisode{'s' if episode_count > 1 else ''})"),
+            'episode_count': episode_count,
+            'language_tag': self.media_info.get('language_tag', ''),
+            'language': self.language,
+            'audio_languages': self.audio_languages,
+            'format': self.format,
+            'duration': duration,
+            'bbcode_duration': bbcode_duration,
+            'source': self.source,
+            'resolution': self.resolution,
+            'width': self.width,
+            'height': self.height,
+            'video_codec': self.video_codec,
+            'video_codec_short': self.video_codec_short,
+            'bitrate': self.bitrate_kbps,
+            'audio_codecs': self.audio_codecs,
+            'subtitles': self.subtitles,
+        }
+        return self._context
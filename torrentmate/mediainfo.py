@@ -2,9 +2,51 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import re
+import math
+import bisect
 import subprocess
 import json
-from typing import Dict, Set, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+
+# orjson parses the mediainfo output faster when installed, its errors subclass json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Release sources recognized in the movie name, by lower-cased spelling
+_SOURCES = {source.lower(): source for source in ('BluRay', 'HDTV', 'WEB-DL', 'WEBRip', 'DVDRip', 'BDRip', 'BRRip')}
+_SOURCE_RE = re.compile('|'.join(re.escape(source) for source in _SOURCES), re.IGNORECASE)
+
+# Resolution labels by minimum video height, below 720 the height itself is used (e.g. 576p)
+_RESOLUTION_HEIGHTS = (720, 1080, 2160)
+_RESOLUTION_LABELS = (None, '720p', '1080p', '4K')
+
+# Language tags for the audio languages reported by mediainfo
+_LANGUAGE_MAP = {
+    'French': 'FRENCH',
+    'English': 'ENGLISH',
+    'fr': 'FRENCH',
+    'en': 'ENGLISH',
+    'es': 'SPANISH',
+    'de': 'GERMAN',
+    'it': 'ITALIAN'
+}
+
+def _to_float(value: Any) -> Optional[float]:
+    """
+    Convert a mediainfo field to a float.
+    
+    :param value: Any - Field value, usually a numeric string
+    :return: Optional[float] - Finite float value, None if missing or not a number
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
 
 class MediaInfo:
     """
@@ -18,31 +60,29 @@ class MediaInfo:
         :param file_path: str - Path to the media file to analyze
         """
         self.file_path = file_path
-        self.raw_output = ""  # Store raw mediainfo output
+        self._raw_output: Optional[str] = None  # Raw mediainfo output, fetched on first use
+        self._track_handlers = {
+            'General': self._process_general_track,
+            'Video': self._process_video_track,
+            'Audio': self._process_audio_track,
+            'Text': self._process_text_track,
+        }
         self.info = self._run_mediainfo()
         self.metadata = self._extract_metadata()
 
     def _run_mediainfo(self) -> Dict[str, Any]:
         """
         Execute mediainfo on the file and return the parsed JSON output.
-        Also stores the raw text output for later use.
         
         :return: Dict[str, Any] - Parsed JSON data from mediainfo
         """
         try:
-            # First get the raw text output
-            raw_result = subprocess.run(
-                ['mediainfo', self.file_path],
-                capture_output=True, text=True, check=True
-            )
-            self.raw_output = raw_result.stdout
-            
-            # Then get the JSON output for processing
             json_result = subprocess.run(
                 ['mediainfo', '--Output=JSON', self.file_path],
-                capture_output=True, text=True, check=True
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True
             )
-            return json.loads(json_result.stdout)
+            # Both parsers accept the raw UTF-8 bytes, no need to decode them first
+            return _json_loads(json_result.stdout)
         except subprocess.CalledProcessError as e:
             print(f"Error running mediainfo: {e}")
             sys.exit(1)
@@ -52,11 +92,29 @@ class MediaInfo:
     
     def get_raw_output(self) -> str:
         """
-        Return the raw mediainfo output.
+        Return the raw mediainfo output, running mediainfo in text mode on first call.
+        
+        Unlike the JSON call made at construction, a failure here raises
+        subprocess.CalledProcessError instead of exiting, since this can run on a worker thread.
+        
+        :return: str - Raw mediainfo output
+        """
+        if self._raw_output is None:
+            raw_result = subprocess.run(
+                ['mediainfo', self.file_path],
+                capture_output=True, text=True, check=True
+            )
+            self._raw_output = raw_result.stdout
+        return self._raw_output
+
+    @property
+    def raw_output(self) -> str:
+        """
+        Raw mediainfo output.
         
         :return: str - Raw mediainfo output
         """
-        return self.raw_output
+        return self.get_raw_output()
 
     def _extract_metadata(self) -> Dict[str, Any]:
         """
@@ -69,14 +127,9 @@ class MediaInfo:
         # Process only if media and track are in the info
         if 'media' in self.info and 'track' in self.info['media']:
             for track in self.info['media']['track']:
-                if track['@type'] == 'General':
-                    self._process_general_track(track, info)
-                elif track['@type'] == 'Video':
-                    self._process_video_track(track, info)
-                elif track['@type'] == 'Audio':
-                    self._process_audio_track(track, info)
-                elif track['@type'] == 'Text':
-                    self._process_text_track(track, info)
+                handler = self._track_handlers.get(track.get('@type'))
+                if handler:
+                    handler(track, info)
         
         # Process language tag
         self._process_language_tag(info)
@@ -95,15 +148,18 @@ class MediaInfo:
         info['overall_bitrate'] = track.get('OverallBitRate', 'Unknown')
         info['movie_name'] = track.get('Movie_name', '')
         
+        # Numeric forms used by the NFO and BBCode generators
+        bitrate = _to_float(track.get('OverallBitRate'))
+        if bitrate is not None:
+            info['overall_bitrate_kbps'] = int(bitrate // 1000)
+        duration = _to_float(track.get('Duration'))
+        if duration is not None:
+            info['duration_min'] = int(duration // 60)
+        
         # Try to extract source from movie_name
-        if 'movie_name' in track:
-            sources = ['BluRay', 'HDTV', 'WEB-DL', 'WEBRip', 'DVDRip', 'BDRip', 'BRRip']
-            for source in sources:
-                if source.lower() in track['movie_name'].lower():
-                    info['source'] = source
-                    break
-            else:
-                info['source'] = 'Unknown'
+        if 'Movie_name' in track:
+            match = _SOURCE_RE.search(info['movie_name'])
+            info['source'] = _SOURCES[match.group(0).lower()] if match else 'Unknown'
 
     def _process_video_track(self, track: Dict[str, Any], info: Dict[str, Any]) -> None:
         """
@@ -123,23 +179,17 @@ class MediaInfo:
                 info['video_codec'] = 'AVC (H.264)'
             else:
                 info['video_codec'] = track['Format']
+            # Codec name without its alias, for the torrent title and the BBCode
+            info['video_codec_short'] = info['video_codec'].split(' ', 1)[0]
                 
         info['width'] = track.get('Width', 'Unknown')
         info['height'] = track.get('Height', 'Unknown')
         
         # Determine resolution
         if 'Width' in track and 'Height' in track:
-            width = int(track['Width'])
             height = int(track['Height'])
-            
-            if height >= 2160:
-                info['resolution'] = '4K'
-            elif height >= 1080:
-                info['resolution'] = '1080p'
-            elif height >= 720:
-                info['resolution'] = '720p'
-            else:
-                info['resolution'] = f"{height}p"
+            label = _RESOLUTION_LABELS[bisect.bisect_right(_RESOLUTION_HEIGHTS, height)]
+            info['resolution'] = label or f"{height}p"
         
         info['frame_rate'] = track.get('FrameRate', 'Unknown')
         info['bit_depth'] = track.get('BitDepth', 'Unknown')
@@ -155,10 +205,13 @@ class MediaInfo:
             info['audio_languages'] = []
             info['audio_codecs'] = []
         
-        if 'Language' in track:
-            info['audio_languages'].append(track['Language'])
-        else:
-            info['audio_languages'].append('Unknown')
+        # Interned, the comparison below and the _LANGUAGE_MAP lookup can match by identity
+        language = sys.intern(track.get('Language', 'Unknown'))
+        audio_languages = info['audio_languages']
+        # Track as we go whether the audio languages differ, for the language tag
+        if audio_languages and language != audio_languages[0]:
+            info['_multi_language'] = True
+        audio_languages.append(language)
         
         audio_codec = f"{track.get('Format', '')} {track.get('Channels', '').replace('channels', 'ch')}"
         info['audio_codecs'].append(audio_codec.strip())
@@ -187,22 +240,13 @@ class MediaInfo:
         
         :param info: Dict[str, Any] - Dictionary to update with language tag
         """
+        multi_language = info.pop('_multi_language', False)
         if 'audio_languages' in info:
-            unique_languages: Set[str] = set(info['audio_languages'])
-            if len(unique_languages) > 1:
+            if multi_language:
                 info['language_tag'] = 'MULTI'
             else:
-                language_map = {
-                    'French': 'FRENCH',
-                    'English': 'ENGLISH',
-                    'fr': 'FRENCH',
-                    'en': 'ENGLISH',
-                    'es': 'SPANISH',
-                    'de': 'GERMAN',
-                    'it': 'ITALIAN'
-                }
-                first_lang = list(unique_languages)[0]
-                info['language_tag'] = language_map.get(first_lang, first_lang.upper())
+                first_lang = info['audio_languages'][0]
+                info['language_tag'] = _LANGUAGE_MAP.get(first_lang, first_lang.upper())
 
 
 if __name__ == '__main__':
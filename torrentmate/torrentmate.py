@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Optional
 from .mediainfo import MediaInfo
 from .contentanalyzer import ContentAnalyzer
 from .contentgenerator import ContentGenerator
@@ -15,27 +18,35 @@ This script analyzes media files in a directory, extracts metadata using mediain
 and generates appropriate torrent, NFO, and BBCode files.
 """
 
+# Maximum number of bytes of mktorrent output forwarded at once
+_OUTPUT_CHUNK_SIZE = 65536
+
 class TorrentMate:
     """
     Main class to create torrent, NFO, and BBCode files for media content.
     """
 
-    def __init__(self, folder_path: str, tracker_url: str = "http://tracker.example.com:6969/announce"):
+    def __init__(self, folder_path: str, tracker_url: str = "http://tracker.example.com:6969/announce",
+                 threads: Optional[int] = None):
         """
         Initialize the TorrentMate object.
         
         :param folder_path: str - Path to the folder containing media content
         :param tracker_url: str - URL of the tracker (Default: "http://tracker.example.com:6969/announce")
+        :param threads: Optional[int] - Number of mktorrent hashing threads (Default: number of CPUs)
         """
         self.folder_path = os.path.abspath(folder_path)
         self.tracker_url = tracker_url
+        self.threads = threads if threads is not None else os.cpu_count() or 1
         
-        # Validate folder
+        # Validate folder and thread count
         if not os.path.isdir(self.folder_path):
             raise ValueError(f"Error: {self.folder_path} is not a valid directory")
+        if self.threads < 1:
+            raise ValueError(f"Error: the number of threads must be at least 1, got {self.threads}")
         
         # Initialize components
-        self.analyzer = ContentAnalyzer(self.folder_path)
+        self.analyzer = ContentAnalyzer.from_folder(self.folder_path)
         first_video = self.analyzer.find_first_video_file()
         
         # Store the MediaInfo instance to access raw output later
@@ -58,12 +69,23 @@ class TorrentMate:
                 'mktorrent',
                 '-v',                     # Verbose mode
                 '-l', '24',               # Piece size (24 = 16 MB)
+                '-t', str(self.threads),  # Hashing threads
                 '-a', self.tracker_url,   # Tracker URL
                 '-o', torrent_file,       # Torrent file name
                 self.folder_path          # Source folder
             ]
             
-            subprocess.run(command, check=True)
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            try:
+                self._forward_output(process.stdout)
+            except BaseException:
+                # Don't leave mktorrent writing to a closed pipe
+                process.kill()
+                raise
+            finally:
+                process.wait()
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, command)
             print(f"Torrent file created successfully: {torrent_file}")
             return True
         except subprocess.CalledProcessError as e:
@@ -73,6 +95,27 @@ class TorrentMate:
             print("mktorrent command not found or not in PATH")
             return False
 
+    def _forward_output(self, stream: IO[bytes]) -> None:
+        """
+        Forward the output of an external command to stdout as it is produced.
+        
+        :param stream: IO[bytes] - Output stream of the command
+        """
+        # Bytes are copied as is, so progress lines redrawn with "\r" and
+        # file names that aren't valid UTF-8 reach the terminal unchanged.
+        # A stdout without a byte layer (redirected to StringIO, Jupyter)
+        # gets the decoded text instead.
+        with stream:
+            for chunk in iter(lambda: stream.read1(_OUTPUT_CHUNK_SIZE), b''):
+                # Flush what other threads printed first, to keep the lines in order
+                sys.stdout.flush()
+                out = getattr(sys.stdout, 'buffer', None)
+                if out is None:
+                    sys.stdout.write(chunk.decode(errors='replace'))
+                else:
+                    out.write(chunk)
+                    out.flush()
+
     def create_nfo(self) -> bool:
         """
         Create the NFO file with raw mediainfo output.
@@ -105,7 +148,7 @@ class TorrentMate:
         bbcode_file = f"{self.torrent_title}.txt"
         
         try:
-            bbcode_content = self.generator.generate_bbcode_content()
+            bbcode_content = self.generator.generate_bbcode_content(self.torrent_title)
             with open(bbcode_file, 'w', encoding='utf-8') as f:
                 f.write(bbcode_content)
             print(f"BBCode description created: {bbcode_file}")
@@ -120,12 +163,34 @@ class TorrentMate:
         
         :return: bool - True if all operations were successful, False otherwise
         """
-        nfo_success = self.create_nfo()
-        bbcode_success = self.create_bbcode()
-        torrent_success = self.create_torrent()
+        # Write the NFO and BBCode files before starting mktorrent, so that they are
+        # always part of the torrent when it is created from inside the content folder
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            nfo_future = executor.submit(self.create_nfo)
+            bbcode_future = executor.submit(self.create_bbcode)
+            
+            # Wait for both steps so that all errors get reported
+            results = [nfo_future.result(), bbcode_future.result()]
         
-        return nfo_success and bbcode_success and torrent_success
+        results.append(self.create_torrent())
+        
+        return all(results)
+
 
+def _positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer command line argument.
+    
+    :param value: str - Argument value
+    :return: int - Parsed integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 def main():
     """
@@ -135,11 +200,13 @@ def main():
     parser.add_argument('folder', help='Path to the folder to process')
     parser.add_argument('--tracker', '-t', default='http://tracker.example.com:6969/announce', 
                         help='Tracker URL (default: http://tracker.example.com:6969/announce)')
+    parser.add_argument('--threads', type=_positive_int, default=None,
+                        help='Number of threads used by mktorrent to hash pieces (default: number of CPUs)')
     
     args = parser.parse_args()
     
     try:
-        creator = TorrentMate(args.folder, args.tracker)
+        creator = TorrentMate(args.folder, args.tracker, args.threads)
         success = creator.create_all()
         
         if success: